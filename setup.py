@@ -9,15 +9,21 @@ setup(name='target-bigquery',
       url='https://github.com/RealSelf/target-bigquery',
       classifiers=['Programming Language :: Python :: 3 :: Only'],
       py_modules=['target_bigquery'],
+      python_requires='>=3.9',
       install_requires=[
           'jsonschema==2.6.0',
           'simplejson~=3.11.1',
+          'orjson>=3.3.0; platform_python_implementation != "PyPy"',
           'singer-python>=1.5.0',
           'google-api-python-client>=1.6.2',
           'google-cloud>=0.34.0',
           'google-cloud-bigquery>=1.9.0',
           'oauth2client',
       ],
+      extras_require={
+          'msgspec': ['msgspec>=0.18.0'],
+          'gcs': ['google-cloud-storage>=3.0.0'],
+      },
       entry_points='''
           [console_scripts]
           target-bigquery=target_bigquery:main
@@ -3,11 +3,19 @@
 import argparse
 import io
 import sys
+import time
 import simplejson as json
 import logging
 import collections
-
-from jsonschema import validate
+import queue
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+import decimal
+import functools
+from typing import Any, List, Optional
+
+from jsonschema.validators import validator_for
 import singer
 
 from oauth2client import tools
@@ -20,6 +28,22 @@ from google.cloud.bigquery import SchemaField
 from google.cloud.bigquery import LoadJobConfig
 from google.api_core import exceptions
 
+try:
+    import orjson
+except ImportError:
+    # orjson has no PyPy build; fast_json is unavailable without it.
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from google.cloud import storage
+except ImportError:
+    storage = None
+
 try:
     parser = argparse.ArgumentParser(parents=[tools.argparser])
     parser.add_argument("-c", "--config", help="Config file", required=True)
@@ -38,6 +62,12 @@ SCOPES = [
 CLIENT_SECRET_FILE = "client_secret.json"
 APPLICATION_NAME = "Singer BigQuery Target"
 
+PARSE_ERRORS = (json.decoder.JSONDecodeError,)
+if orjson is not None:
+    PARSE_ERRORS += (orjson.JSONDecodeError,)
+if msgspec is not None:
+    PARSE_ERRORS += (msgspec.DecodeError,)
+
 StreamMeta = collections.namedtuple(
     "StreamMeta", ["schema", "key_properties", "bookmark_properties"]
 )
@@ -51,8 +81,105 @@ def emit_state(state):
         sys.stdout.flush()
 
 
-def clear_dict_hook(items):
-    return {k: v if v is not None else "" for k, v in items}
+def _decimal_default(obj):
+    # orjson has no native Decimal support; keep full precision as a string.
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    raise TypeError
+
+
+# NEWLINE_DELIMITED_JSON expects literal JSON formatted data, with a newline character splitting each row.
+def _encode_record(record):
+    return bytes(json.dumps(record, use_decimal=True) + "\n", "UTF-8")
+
+
+def _fast_encode_record(record):
+    # orjson writes the trailing newline into the same output buffer, so the
+    # row is encoded straight to its final bytes with no extra concatenation.
+    return orjson.dumps(
+        record, default=_decimal_default, option=orjson.OPT_APPEND_NEWLINE
+    )
+
+
+def _message_from_dict(obj):
+    # Mirrors singer.parse_message for an already decoded line.
+    msg_type = obj["type"]
+
+    if msg_type == "RECORD":
+        # time_extracted is not used by this target, so it is not parsed
+        # into a datetime; record timestamps stay strings end to end.
+        return singer.RecordMessage(
+            stream=obj["stream"], record=obj["record"], version=obj.get("version")
+        )
+
+    elif msg_type == "SCHEMA":
+        return singer.SchemaMessage(
+            stream=obj["stream"],
+            schema=obj["schema"],
+            key_properties=obj["key_properties"],
+            bookmark_properties=obj.get("bookmark_properties"),
+        )
+
+    elif msg_type == "STATE":
+        return singer.StateMessage(value=obj["value"])
+
+    elif msg_type == "ACTIVATE_VERSION":
+        return singer.ActivateVersionMessage(
+            stream=obj["stream"], version=obj["version"]
+        )
+
+    return None
+
+
+def _fast_parse(line):
+    return _message_from_dict(orjson.loads(line))
+
+
+if msgspec is not None:
+
+    class _RawMessage(msgspec.Struct):
+        # The record is kept as its raw JSON bytes; it is only decoded when
+        # validated against its stream's schema.
+        type: str
+        stream: Optional[str] = None
+        record: msgspec.Raw = None
+        schema: Optional[dict] = None
+        key_properties: Optional[list] = None
+        bookmark_properties: Optional[list] = None
+        value: Any = None
+        version: Any = None
+        time_extracted: Optional[str] = None
+
+    _raw_message_decoder = msgspec.json.Decoder(_RawMessage)
+
+
+def _msgspec_parse(line):
+    return _message_from_dict(
+        msgspec.structs.asdict(_raw_message_decoder.decode(line))
+    )
+
+
+def _raw_encode_record(record):
+    return bytes(record) + b"\n"
+
+
+def _write_chunks(chunks, out, done):
+    # Runs on a writer thread per stream; None marks the end of the stream.
+    while True:
+        chunk = chunks.get()
+        if chunk is None:
+            break
+        if not done.done():
+            try:
+                out.write(chunk)
+            except Exception as e:
+                # fail the future right away so the reader sees the error
+                # on its next chunk, but keep draining so it is never
+                # blocked on a full queue.
+                done.set_exception(e)
+
+    if not done.done():
+        done.set_result(None)
 
 
 def define_schema(field, name):
@@ -121,6 +248,139 @@ def build_schema(schema):
     return output_schema
 
 
+@functools.lru_cache(maxsize=128)
+def _build_schema_from_json(schema_json):
+    return tuple(build_schema(json.loads(schema_json, use_decimal=True)))
+
+
+def build_schema_cached(schema):
+    # Taps commonly repeat identical SCHEMA messages, so key the cache on the
+    # schema's JSON encoding. Keys are not sorted: property order decides the
+    # column order of the table.
+    if orjson is not None:
+        schema_json = orjson.dumps(schema, default=_decimal_default)
+    else:
+        schema_json = json.dumps(schema, use_decimal=True)
+    return _build_schema_from_json(schema_json)
+
+
+def build_validator(schema):
+    # Resolve the draft and check the schema once, instead of on every record.
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+MSGSPEC_TYPES = {"string": str, "integer": int, "number": float, "boolean": bool}
+
+
+def define_msgspec_type(field):
+    nullable = False
+
+    if "type" not in field and "anyOf" in field:
+        types = [option for option in field["anyOf"] if option.get("type") != "null"]
+        if len(types) != 1:
+            return Any
+        nullable = len(types) < len(field["anyOf"])
+        field = types[0]
+
+    field_types = field.get("type")
+    if field_types is None:
+        return Any
+    if not isinstance(field_types, list):
+        field_types = [field_types]
+    if "null" in field_types:
+        nullable = True
+        field_types = [field_type for field_type in field_types if field_type != "null"]
+    if len(field_types) != 1:
+        # msgspec unions are restricted; leave mixed types unchecked.
+        return Any
+
+    if field_types[0] == "object":
+        if field.get("properties"):
+            msgspec_type = build_msgspec_struct(field)
+        else:
+            msgspec_type = dict
+    elif field_types[0] == "array":
+        items = define_msgspec_type(field.get("items") or {})
+        msgspec_type = List[items]
+    else:
+        msgspec_type = MSGSPEC_TYPES.get(field_types[0], Any)
+
+    if nullable:
+        msgspec_type = Optional[msgspec_type]
+    return msgspec_type
+
+
+def build_msgspec_struct(schema):
+    # Property names need not be identifiers, so use generated field names
+    # and rename them to the JSON keys.
+    fields = []
+    rename = {}
+    for index, (key, field) in enumerate(schema["properties"].items()):
+        name = "field_{}".format(index)
+        rename[name] = key
+        fields.append((name, define_msgspec_type(field or {}), None))
+
+    return msgspec.defstruct("Record", fields, rename=rename)
+
+
+def build_decoder(schema):
+    # Type-checks records while decoding them, standing in for jsonschema.
+    # Only JSON types are checked, not formats or other keywords.
+    if not schema.get("properties"):
+        # as for nested objects, a schema without properties accepts any
+        # object.
+        return msgspec.json.Decoder(dict)
+    return msgspec.json.Decoder(build_msgspec_struct(schema))
+
+
+def _ignore_message(msg):
+    # This is experimental and won't be used yet
+    pass
+
+
+def _unrecognized_message(msg):
+    raise Exception("Unrecognized message {}".format(msg))
+
+
+def process_lines(lines, parse_message, handlers):
+    # The per-line loop of both persist functions: parse, then one dict
+    # lookup on the message type instead of a chain of isinstance checks.
+    # Everything it touches per line is bound to a local first.
+    parse_errors = PARSE_ERRORS
+    unrecognized_message = _unrecognized_message
+    get_handler = handlers.get
+
+    for line in lines:
+        try:
+            msg = parse_message(line)
+        except parse_errors:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8", errors="replace")
+            logger.error("Unable to parse:\n{}".format(line))
+            raise
+
+        get_handler(type(msg), unrecognized_message)(msg)
+
+
+def sample_validator(validate, sample_rate):
+    # Checks each of the first sample_rate records of a stream, then only one
+    # in every sample_rate; schema drift tends to show up early.
+    if sample_rate <= 1:
+        return validate
+
+    count = 0
+
+    def validate_sample(record):
+        nonlocal count
+        count += 1
+        if count <= sample_rate or not count % sample_rate:
+            validate(record)
+
+    return validate_sample
+
+
 def persist_lines_job(
     project_id,
     dataset_id,
@@ -130,64 +390,125 @@ def persist_lines_job(
     allow_schema_update=False,
     ignore_unknown_fields=False,
     autodetect_schema=False,
+    fast_json=False,
+    parallel_loads=6,
+    gcs_bucket=None,
+    buffer_size=8 * 1024 * 1024,
+    use_msgspec=False,
+    queue_size=4,
+    validate_sample_rate=1,
 ):
     state = None
     schemas = {}
+    validators = {}
     key_properties = {}
     rows = {}
+    buffers = {}
+    queues = {}
+    writers = {}
+    blobs = {}
+    schema_futures = {}
     errors = {}
 
     bigquery_client = bigquery.Client(project=project_id)
 
-    for line in lines:
+    if gcs_bucket:
+        if storage is None:
+            raise Exception("gcs_bucket requires the google-cloud-storage package")
+        bucket = storage.Client(project=project_id).bucket(gcs_bucket)
+
+    if use_msgspec:
+        if msgspec is None:
+            raise Exception("use_msgspec requires the msgspec package")
+        parse_message = _msgspec_parse
+        encode_record = _raw_encode_record
+    elif fast_json:
+        if orjson is None:
+            raise Exception("fast_json requires the orjson package")
+        parse_message = _fast_parse
+        encode_record = _fast_encode_record
+    else:
+        parse_message = singer.parse_message
+        encode_record = _encode_record
+
+    def handle_record(msg):
+        nonlocal state
+        stream = msg.stream
+        # Buffers exist once the stream's SchemaMessage was seen, so the
+        # lookup doubles as the schema check.
         try:
-            msg = singer.parse_message(line)
-        except json.decoder.JSONDecodeError:
-            logger.error("Unable to parse:\n{}".format(line))
-            raise
-
-        if isinstance(msg, singer.RecordMessage):
-            if msg.stream not in schemas:
-                raise Exception(
-                    "A record for stream {} was encountered before a corresponding schema".format(
-                        msg.stream
-                    )
+            buffer = buffers[stream]
+        except KeyError:
+            raise Exception(
+                "A record for stream {} was encountered before a corresponding schema".format(
+                    stream
                 )
-
-            schema = schemas[msg.stream]
-
-            if validate_records:
-                validate(msg.record, schema)
-
-            # NEWLINE_DELIMITED_JSON expects literal JSON formatted data, with a newline character splitting each row.
-            dat = bytes(json.dumps(msg.record, use_decimal=True) + "\n", "UTF-8")
-
-            rows[msg.stream].write(dat)
-            state = None
-
-        elif isinstance(msg, singer.StateMessage):
-            logger.debug("Setting state to {}".format(msg.value))
-            state = msg.value
-
-        elif isinstance(msg, singer.SchemaMessage):
-            table = msg.stream
-            schemas[table] = msg.schema
-            key_properties[table] = msg.key_properties
-            rows[table] = TemporaryFile(mode="w+b")
-            errors[table] = None
-
-        elif isinstance(msg, singer.ActivateVersionMessage):
-            # This is experimental and won't be used yet
-            pass
-
+            ) from None
+
+        if validate_records:
+            validators[stream](msg.record)
+
+        # Collect rows in memory and hand them to the stream's writer
+        # thread in large chunks, so file or network I/O overlaps with
+        # parsing. The bounded queue applies backpressure.
+        buffer += encode_record(msg.record)
+        if len(buffer) >= buffer_size:
+            if writers[stream].done():
+                # the writer only finishes early on an error; raise it now
+                # rather than parsing the rest of the input for nothing.
+                writers[stream].result()
+            queues[stream].put(buffer)
+            buffers[stream] = bytearray()
+        state = None
+
+    def handle_state(msg):
+        nonlocal state
+        logger.debug("Setting state to {}".format(msg.value))
+        state = msg.value
+
+    def handle_schema(msg):
+        table = msg.stream
+        if table in queues:
+            # stop the writer of the file this schema replaces, and raise any
+            # error it hit before its future is replaced below.
+            queues[table].put(None)
+            writers[table].result()
+            if gcs_bucket:
+                # cancel the replaced upload so no partial object is left.
+                rows[table].terminate()
+        schemas[table] = msg.schema
+        key_properties[table] = msg.key_properties
+        if not autodetect_schema:
+            # ready by the time the load job needs it.
+            schema_futures[table] = executor.submit(build_schema_cached, msg.schema)
+        if validate_records and use_msgspec:
+            validators[table] = sample_validator(
+                build_decoder(msg.schema).decode, validate_sample_rate
+            )
+        elif validate_records:
+            validators[table] = sample_validator(
+                build_validator(msg.schema).validate, validate_sample_rate
+            )
+        if gcs_bucket:
+            # Records go straight into a resumable upload, which only
+            # starts sending once data is written to it.
+            blobs[table] = bucket.blob(
+                "{}/{}-{}.json".format(dataset_id, table, uuid.uuid4().hex)
+            )
+            rows[table] = blobs[table].open("wb")
         else:
-            raise Exception("Unrecognized message {}".format(msg))
-
-    for table in rows.keys():
-        if not rows[table].tell():
-            # this means the tmp file is empty, so nothing to upload.
-            continue
-
+            rows[table] = TemporaryFile(mode="w+b")
+        buffers[table] = bytearray()
+        queues[table] = queue.Queue(maxsize=queue_size)
+        writers[table] = Future()
+        threading.Thread(
+            target=_write_chunks,
+            args=(queues[table], rows[table], writers[table]),
+            daemon=True,
+        ).start()
+        errors[table] = None
+
+    def load_table(table):
         table_ref = bigquery_client.dataset(dataset_id).table(table)
         load_config = LoadJobConfig()
         load_config.source_format = SourceFormat.NEWLINE_DELIMITED_JSON
@@ -196,7 +517,7 @@ def persist_lines_job(
         if autodetect_schema:
             load_config.autodetect = True
         else:
-            load_config.schema = build_schema(schemas[table])
+            load_config.schema = schema_futures[table].result()
 
         if allow_schema_update:
             load_config.schema_update_options = [
@@ -207,25 +528,107 @@ def persist_lines_job(
         if truncate:
             load_config.write_disposition = WriteDisposition.WRITE_TRUNCATE
 
-        rows[table].seek(0)
         logger.info("loading {} to Bigquery.\n".format(table))
-        load_job = bigquery_client.load_table_from_file(
-            rows[table], table_ref, job_config=load_config
-        )
+        if gcs_bucket:
+            rows[table].close()
+            load_job = bigquery_client.load_table_from_uri(
+                "gs://{}/{}".format(gcs_bucket, blobs[table].name),
+                table_ref,
+                job_config=load_config,
+            )
+        else:
+            rows[table].seek(0)
+            load_job = bigquery_client.load_table_from_file(
+                rows[table], table_ref, job_config=load_config
+            )
         logger.info("loading job {}".format(load_job.job_id))
         logger.info(load_job.result())
 
+    # Shared by the schema builds and the load jobs at the end.
+    executor = ThreadPoolExecutor(max_workers=parallel_loads)
+    try:
+        process_lines(
+            lines,
+            parse_message,
+            {
+                singer.RecordMessage: handle_record,
+                singer.StateMessage: handle_state,
+                singer.SchemaMessage: handle_schema,
+                singer.ActivateVersionMessage: _ignore_message,
+            },
+        )
+
+        for table in queues.keys():
+            queues[table].put(buffers[table])
+            queues[table].put(None)
+
+        for table in writers.keys():
+            writers[table].result()
+
+        # Load jobs are independent per table, so upload and wait on them
+        # concurrently. The pool is kept small to stay clear of API quotas.
+        futures = [
+            executor.submit(load_table, table)
+            for table in rows.keys()
+            # an empty file means there is nothing to upload.
+            if rows[table].tell()
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+    finally:
+        # drop queued schema builds and loads after an error; running loads
+        # finish before their files are cleaned up below.
+        executor.shutdown(cancel_futures=True)
+
+        for table in queues.keys():
+            if not writers[table].done() or writers[table].exception():
+                # an error left this writer running, or draining after its
+                # own failure; stop it before its file is dropped.
+                queues[table].put(None)
+                wait([writers[table]])
+
+        # Staged objects are removed whether or not their load succeeded.
+        # Uploads that were never finalized are cancelled, which keeps
+        # garbage collection from finalizing them into partial objects.
+        for table in blobs.keys():
+            if rows[table].closed:
+                try:
+                    blobs[table].delete()
+                except exceptions.NotFound:
+                    pass
+            else:
+                rows[table].terminate()
+
     return state
 
 
 def persist_lines_stream(
-    project_id, dataset_id, lines=None, validate_records=True, allow_schema_update=False
+    project_id,
+    dataset_id,
+    lines=None,
+    validate_records=True,
+    allow_schema_update=False,
+    fast_json=False,
+    stream_batch_size=500,
+    micro_load=False,
+    micro_load_size=5000,
+    micro_load_interval=60,
+    max_load_jobs=1000,
+    min_load_spacing=86400 / 1500,
+    validate_sample_rate=1,
 ):
     state = None
     schemas = {}
+    validators = {}
     key_properties = {}
     tables = {}
     rows = {}
+    batches = {}
+    batch_started = {}
+    load_jobs = {}
+    last_load = {}
+    pending_loads = {}
     errors = {}
 
     bigquery_client = bigquery.Client(project=project_id)
@@ -239,57 +642,141 @@ def persist_lines_stream(
     except exceptions.Conflict:
         pass
 
-    for line in lines:
-        try:
-            msg = singer.parse_message(line)
-        except json.decoder.JSONDecodeError:
-            logger.error("Unable to parse:\n{}".format(line))
-            raise
-
-        if isinstance(msg, singer.RecordMessage):
-            if msg.stream not in schemas:
-                raise Exception(
-                    "A record for stream {} was encountered before a corresponding schema".format(
-                        msg.stream
-                    )
-                )
+    def micro_load_batch(table):
+        load_config = LoadJobConfig()
+        load_config.source_format = SourceFormat.NEWLINE_DELIMITED_JSON
+        load_config.schema = tables[table].schema
 
-            schema = schemas[msg.stream]
+        if allow_schema_update:
+            load_config.schema_update_options = [
+                SchemaUpdateOption.ALLOW_FIELD_ADDITION,
+                SchemaUpdateOption.ALLOW_FIELD_RELAXATION,
+            ]
 
-            if validate_records:
-                validate(msg.record, schema)
+        # raise any error from the table's previous load before starting
+        # the next one, so at most one job per table is in flight.
+        if table in pending_loads:
+            pending_loads.pop(table).result()
 
-            errors[msg.stream] = bigquery_client.insert_rows_json(
-                tables[msg.stream], [msg.record]
-            )
-            rows[msg.stream] += 1
+        data = io.BytesIO(b"".join(map(encode_record, batches[table])))
+        load_job = bigquery_client.load_table_from_file(
+            data, tables[table], job_config=load_config
+        )
+        load_jobs[table] += 1
+        last_load[table] = time.monotonic()
+        logger.info("micro-load job {} for {}".format(load_job.job_id, table))
+        # the upload is done; parsing continues while BigQuery runs the job.
+        pending_loads[table] = load_job
+
+    def flush_batch(table):
+        if not batches[table]:
+            return
+
+        # Load jobs are capped per table per day. This run counts only its
+        # own jobs: once it has started max_load_jobs for a table, the
+        # remaining rows go through streaming inserts instead.
+        if micro_load and load_jobs[table] < max_load_jobs:
+            micro_load_batch(table)
+        else:
+            batch = batches[table]
+            for start in range(0, len(batch), stream_batch_size):
+                errors[table] += bigquery_client.insert_rows_json(
+                    tables[table], batch[start : start + stream_batch_size]
+                )
 
-            state = None
+        batches[table] = []
+        batch_started[table] = time.monotonic()
 
-        elif isinstance(msg, singer.StateMessage):
-            logger.debug("Setting state to {}".format(msg.value))
-            state = msg.value
+    if fast_json and orjson is None:
+        raise Exception("fast_json requires the orjson package")
+    parse_message = _fast_parse if fast_json else singer.parse_message
+    encode_record = _fast_encode_record if fast_json else _encode_record
 
-        elif isinstance(msg, singer.SchemaMessage):
-            table = msg.stream
-            schemas[table] = msg.schema
-            key_properties[table] = msg.key_properties
-            tables[table] = bigquery.Table(
-                dataset.table(table), schema=build_schema(schemas[table])
+    def handle_record(msg):
+        nonlocal state
+        stream = msg.stream
+        try:
+            batch = batches[stream]
+        except KeyError:
+            raise Exception(
+                "A record for stream {} was encountered before a corresponding schema".format(
+                    stream
+                )
+            ) from None
+
+        if validate_records:
+            validators[stream](msg.record)
+
+        batch.append(msg.record)
+        if micro_load and load_jobs[stream] < max_load_jobs:
+            # Size and age only trigger a load once min_load_spacing has
+            # passed since the table's last one, which paces a busy stream
+            # under the daily load job quota; rows keep collecting meanwhile.
+            now = time.monotonic()
+            if now - last_load[stream] >= min_load_spacing and (
+                len(batch) >= micro_load_size
+                or now - batch_started[stream] >= micro_load_interval
+            ):
+                flush_batch(stream)
+        elif len(batch) >= stream_batch_size:
+            flush_batch(stream)
+        rows[stream] += 1
+
+        state = None
+
+    def handle_state(msg):
+        nonlocal state
+        logger.debug("Setting state to {}".format(msg.value))
+        state = msg.value
+
+    def handle_schema(msg):
+        table = msg.stream
+        # Taps often repeat an unchanged schema; the table keeps its batch
+        # then, so the repeat does not start an unpaced load job.
+        unchanged = table in batches and build_schema_cached(
+            msg.schema
+        ) == build_schema_cached(schemas[table])
+        if table in batches and not unchanged:
+            # rows buffered under the previous schema go out first
+            flush_batch(table)
+        schemas[table] = msg.schema
+        key_properties[table] = msg.key_properties
+        if validate_records:
+            validators[table] = sample_validator(
+                build_validator(msg.schema).validate, validate_sample_rate
             )
-            rows[table] = 0
-            errors[table] = None
-            try:
-                tables[table] = bigquery_client.create_table(tables[table])
-            except exceptions.Conflict:
-                pass
-
-        elif isinstance(msg, singer.ActivateVersionMessage):
-            # This is experimental and won't be used yet
+        if unchanged:
+            return
+        tables[table] = bigquery.Table(
+            dataset.table(table), schema=build_schema_cached(schemas[table])
+        )
+        rows[table] = 0
+        batches[table] = []
+        batch_started[table] = time.monotonic()
+        load_jobs.setdefault(table, 0)
+        last_load.setdefault(table, float("-inf"))
+        errors.setdefault(table, [])
+        try:
+            tables[table] = bigquery_client.create_table(tables[table])
+        except exceptions.Conflict:
             pass
 
-        else:
-            raise Exception("Unrecognized message {}".format(msg))
+    process_lines(
+        lines,
+        parse_message,
+        {
+            singer.RecordMessage: handle_record,
+            singer.StateMessage: handle_state,
+            singer.SchemaMessage: handle_schema,
+            singer.ActivateVersionMessage: _ignore_message,
+        },
+    )
+
+    for table in batches.keys():
+        flush_batch(table)
+
+    for load_job in pending_loads.values():
+        load_job.result()
 
     for table in errors.keys():
         if not errors[table]:
@@ -315,11 +802,26 @@ def main():
         truncate = False
 
     validate_records = config.get("validate_records", True)
+    validate_sample_rate = config.get("validate_sample_rate", 1)
     allow_schema_update = config.get("allow_schema_update", False)
     ignore_unknown_fields = config.get("ignore_unknown_fields", False)
     autodetect_schema = config.get("autodetect_schema", False)
-
-    input_data = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    fast_json = config.get("fast_json", False)
+    stream_batch_size = config.get("stream_batch_size", 500)
+    parallel_loads = config.get("parallel_loads", 6)
+    gcs_bucket = config.get("gcs_bucket")
+    buffer_size = config.get("buffer_size", 8 * 1024 * 1024)
+    use_msgspec = config.get("use_msgspec", False)
+    queue_size = config.get("queue_size", 4)
+    micro_load = config.get("load_mode") == "micro_load"
+    micro_load_size = config.get("micro_load_size", 5000)
+    micro_load_interval = config.get("micro_load_interval", 60)
+    max_load_jobs = config.get("max_load_jobs", 1000)
+    min_load_spacing = config.get("min_load_spacing", 86400 / 1500)
+
+    # Iterating the binary buffer yields bytes lines straight from C; both
+    # parsers accept bytes, so no UTF-8 decode step is needed.
+    input_data = sys.stdin.buffer
 
     if config.get("stream_data", True):
         state = persist_lines_stream(
@@ -328,6 +830,14 @@ def main():
             input_data,
             validate_records=validate_records,
             allow_schema_update=allow_schema_update,
+            fast_json=fast_json,
+            stream_batch_size=stream_batch_size,
+            micro_load=micro_load,
+            micro_load_size=micro_load_size,
+            micro_load_interval=micro_load_interval,
+            max_load_jobs=max_load_jobs,
+            min_load_spacing=min_load_spacing,
+            validate_sample_rate=validate_sample_rate,
         )
     else:
         state = persist_lines_job(
@@ -339,6 +849,13 @@ def main():
             allow_schema_update=allow_schema_update,
             ignore_unknown_fields=ignore_unknown_fields,
             autodetect_schema=autodetect_schema,
+            fast_json=fast_json,
+            parallel_loads=parallel_loads,
+            gcs_bucket=gcs_bucket,
+            buffer_size=buffer_size,
+            use_msgspec=use_msgspec,
+            queue_size=queue_size,
+            validate_sample_rate=validate_sample_rate,
         )
 
     emit_state(state)